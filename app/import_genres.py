@@ -1,46 +1,100 @@
+import asyncio
 import os
 import sys
-import json
-import csv
 import logging
-from typing import List, Dict, Any
+from functools import partial
+from itertools import chain, islice
+from typing import (
+    Annotated, AsyncIterator, Callable, Iterator, List, Dict, Any, Optional,
+    Set, Tuple
+)
 from uuid import UUID
-from pathlib import Path
 
+import ijson
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import pydantic
-from pydantic import BaseModel, Field, field_validator
+from pydantic import ConfigDict, Field, StringConstraints, TypeAdapter
+from pydantic.dataclasses import dataclass
 from dotenv import load_dotenv
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+try:
+    import uvloop
+except ImportError:  # uvloop не собирается под Windows
+    uvloop = None
 
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
 
 # flake8: noqa: E402
-from database.db import Base, engine, async_session
-from genre.models import Genre
-
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("import_genres.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from app.database.db import DATABASE_URL, Base, engine
+from app.genre.models import Genre
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# Импорт пишет через Core напрямую в таблицу, минуя ORM
+genres_table = Genre.__table__
+
+# Число батчей, которые одновременно пишутся в базу
+IMPORT_CONCURRENCY = int(
+    os.getenv("IMPORT_CONCURRENCY", str(min(8, os.cpu_count() or 1)))
+)
 
-class GenreImportModel(BaseModel):
-    """Модель для валидации данных жанра при импорте."""
-    id: UUID = Field(..., description="ID жанра")
-    name: str = Field(
-        ..., min_length=1, max_length=100, description="Название жанра"
+# Semaphore(0) повесил бы импорт на первом батче, а pool_size=0
+# снимает ограничение пула
+if IMPORT_CONCURRENCY < 1:
+    raise ValueError(
+        f"IMPORT_CONCURRENCY должен быть не меньше 1, "
+        f"получено {IMPORT_CONCURRENCY}"
     )
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        return v.strip()
+# Сессии импорта привязываются к отдельному пулу в main(): движок
+# не создается при импорте модуля
+import_session = async_sessionmaker(expire_on_commit=False)
+
+
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra='ignore'))
+class GenreImportModel:
+    """Модель для валидации данных жанра при импорте.
+
+    Dataclass со __slots__ вместо BaseModel: у экземпляров нет __dict__
+    и служебных полей модели, что заметно на больших файлах.
+    """
+    id: Annotated[UUID, Field(description="ID жанра")]
+    name: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=100),
+        Field(description="Название жанра"),
+    ]
+
+
+# Схема валидации списка собирается один раз и используется для всех батчей.
+# В горячем пути вызываются валидатор и сериализатор pydantic-core
+# напрямую, минуя обертку TypeAdapter
+_GENRE_LIST_ADAPTER = TypeAdapter(List[GenreImportModel])
+_GENRE_LIST_VALIDATOR = _GENRE_LIST_ADAPTER.validator
+_GENRE_LIST_SERIALIZER = _GENRE_LIST_ADAPTER.serializer
+
+# Обе колонки читаются как строки: UUID и ограничения проверяет Pydantic.
+# Отсутствующая колонка дает None и ошибку валидации записи
+_CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={"id": pa.string(), "name": pa.string()},
+    include_columns=["id", "name"],
+    include_missing_columns=True,
+)
+
+# Сколько записей JSON разбирается в потоке за один переход
+_JSON_CHUNK_SIZE = 1000
+
+# Прогрев валидатора, чтобы первый реальный батч не платил за инициализацию
+_GENRE_LIST_VALIDATOR.validate_python(
+    [{"id": "00000000-0000-0000-0000-000000000000", "name": "_"}]
+)
 
 
 async def create_tables():
@@ -50,179 +104,453 @@ async def create_tables():
     logger.info("Таблицы успешно созданы")
 
 
-async def read_csv_file(file_path: str) -> List[Dict[str, Any]]:
-    """Чтение данных из CSV файла."""
+async def iterate_in_thread(
+    iterator: Iterator[Any], chunk_size: int
+) -> AsyncIterator[Any]:
+    """Обход блокирующего итератора в отдельном потоке.
+
+    Элементы забираются порциями по chunk_size, чтобы чтение и разбор
+    файла не блокировали event loop.
+    """
+    while True:
+        chunk = await asyncio.to_thread(list, islice(iterator, chunk_size))
+        if not chunk:
+            return
+        for item in chunk:
+            yield item
+
+
+async def read_csv_file(file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    """Потоковое чтение данных из CSV файла по одной записи.
+
+    Файл разбирается C-парсером pyarrow блоками, из каждого блока
+    забираются только колонки id и name. Строка с неверным числом колонок
+    логируется и пропускается; в конце чтения за каждую такую строку
+    отдается пустая запись, которая не пройдет валидацию и попадет
+    в ошибки импорта. Пустой файл дает ноль записей.
+    """
+    count = 0
+    skipped = []
+
+    def skip_invalid_row(row: pacsv.InvalidRow) -> str:
+        # Вызывается из потока парсера; остальные строки блока читаются
+        logger.error(
+            f"Строка {row.number} CSV файла пропущена: ожидалось "
+            f"{row.expected_columns} колонок, получено "
+            f"{row.actual_columns}: {row.text}"
+        )
+        skipped.append(row.number)
+        return "skip"
+
     try:
-        with open(file_path, mode='r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            data = [row for row in reader]
-            logger.info(
-                f"Прочитано {len(data)} записей из CSV файла: {file_path}"
-            )
-            return data
+        if await asyncio.to_thread(os.path.getsize, file_path) == 0:
+            logger.info(f"CSV файл пуст: {file_path}")
+            return
+
+        reader = await asyncio.to_thread(
+            pacsv.open_csv,
+            file_path,
+            parse_options=pacsv.ParseOptions(
+                invalid_row_handler=skip_invalid_row
+            ),
+            convert_options=_CSV_CONVERT_OPTIONS,
+        )
+        with reader:
+            async for record_batch in iterate_in_thread(reader, 1):
+                ids = record_batch.column("id").to_pylist()
+                names = record_batch.column("name").to_pylist()
+                for genre_id, name in zip(ids, names):
+                    count += 1
+                    yield {"id": genre_id, "name": name}
+
+        # Пропущенные строки отдаются в конце: их номера в файле уже
+        # залогированы, здесь они нужны только для подсчета ошибок
+        for _ in skipped:
+            count += 1
+            yield {}
     except Exception as e:
         logger.error(f"Ошибка при чтении CSV файла {file_path}: {str(e)}")
         raise
+    logger.info(f"Прочитано {count} записей из CSV файла: {file_path}")
 
 
-async def read_json_file(file_path: str) -> List[Dict[str, Any]]:
-    """Чтение данных из JSON файла."""
+async def read_json_file(file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    """Потоковое чтение массива жанров из JSON файла по одной записи."""
+    count = 0
     try:
-        with open(file_path, mode='r', encoding='utf-8') as file:
-            data = json.load(file)
-            logger.info(
-                f"Прочитано {len(data)} записей из JSON файла: {file_path}"
-            )
-            return data
+        with await asyncio.to_thread(open, file_path, mode='rb') as file:
+            events = ijson.parse(file)
+            first_event = await asyncio.to_thread(next, events, None)
+            if first_event is None or first_event[1] != 'start_array':
+                raise ValueError(
+                    "JSON файл должен содержать массив записей жанров"
+                )
+
+            rows = ijson.items(chain([first_event], events), 'item')
+            async for row in iterate_in_thread(rows, _JSON_CHUNK_SIZE):
+                count += 1
+                yield row
     except Exception as e:
         logger.error(f"Ошибка при чтении JSON файла {file_path}: {str(e)}")
         raise
+    logger.info(f"Прочитано {count} записей из JSON файла: {file_path}")
 
 
 def validate_genres_data(
-    genres_data: List[Dict[str, Any]]
-) -> List[GenreImportModel]:
-    """Валидация данных жанров с использованием Pydantic."""
-    validated_genres = []
-    errors = []
+    genres_data: List[Dict[str, Any]], start: int = 1
+) -> List[Dict[str, Any]]:
+    """Валидация данных жанров с использованием Pydantic.
 
-    for idx, genre_data in enumerate(genres_data, 1):
-        try:
-            validated_genre = GenreImportModel(**genre_data)
-            validated_genres.append(validated_genre)
-        except pydantic.ValidationError as e:
-            error_msg = f"Ошибка валидации записи #{idx}: {str(e)}"
-            errors.append(error_msg)
-            logger.error(error_msg)
-
-    if errors:
+    Батч валидируется одним вызовом валидатора списка. При ошибках невалидные
+    записи логируются и отбрасываются, остальные валидируются повторно.
+    start задает номер первой записи батча для сообщений об ошибках.
+
+    Возвращает словари {"id": UUID, "name": str}, готовые к передаче
+    в INSERT/UPDATE как параметры.
+    """
+    try:
+        validated = _GENRE_LIST_VALIDATOR.validate_python(genres_data)
+    except pydantic.ValidationError as e:
+        errors: Dict[int, List[str]] = {}
+        for error in e.errors():
+            idx, *field = error["loc"]
+            location = ".".join(str(part) for part in field)
+            message = f"{location}: {error['msg']}" if location else error["msg"]
+            errors.setdefault(idx, []).append(message)
+
+        for idx, messages in errors.items():
+            logger.error(
+                f"Ошибка валидации записи #{start + idx}: "
+                f"{'; '.join(messages)}"
+            )
         logger.warning(
             f"Найдено {len(errors)} ошибок валидации из "
             f"{len(genres_data)} записей"
         )
 
-    return validated_genres
+        valid_rows = [
+            genre_data for idx, genre_data in enumerate(genres_data)
+            if idx not in errors
+        ]
+        validated = _GENRE_LIST_VALIDATOR.validate_python(valid_rows)
+
+    # mode="python" оставляет id уже разобранным uuid.UUID: колонка Uuid
+    # принимает его как есть, без повторного разбора строки при bind
+    return _GENRE_LIST_SERIALIZER.to_python(validated, mode="python")
+
+
+def classify_genres(
+    rows: List[Dict[str, Any]], existing: List[Tuple[UUID, str]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int]:
+    """Разбор записей батча на вставки и обновления.
+
+    Записи классифицируются по порядку, как при построчной обработке:
+    name_by_id и id_by_name отражают состояние таблицы после уже
+    разобранных записей батча, поэтому название, освобожденное раньше
+    в батче, снова свободно. Жанр, найденный по названию под другим id,
+    получает id из файла; оба вида обновлений уходят одним UPDATE.
+
+    Возвращает записи для INSERT, параметры UPDATE и число пропущенных
+    конфликтующих записей.
+    """
+    name_by_id = {genre_id: name for genre_id, name in existing}
+    id_by_name = {name: genre_id for genre_id, name in existing}
+
+    to_insert = []
+    to_update = []
+    errors = 0
+    for row in rows:
+        owner_id = id_by_name.get(row["name"])
+        if row["id"] in name_by_id:
+            target_id = row["id"]
+            if owner_id not in (None, target_id):
+                errors += 1
+                logger.error(
+                    f"Конфликт при импорте жанра {row['id']} - "
+                    f"{row['name']}: название занято, запись пропущена"
+                )
+                continue
+        elif owner_id is not None:
+            target_id = owner_id
+        else:
+            to_insert.append(row)
+            name_by_id[row["id"]] = row["name"]
+            id_by_name[row["name"]] = row["id"]
+            continue
+
+        del id_by_name[name_by_id.pop(target_id)]
+        name_by_id[row["id"]] = row["name"]
+        id_by_name[row["name"]] = row["id"]
+        to_update.append({
+            "b_id": target_id,
+            "b_new_id": row["id"],
+            "b_name": row["name"],
+        })
+
+    return to_insert, to_update, errors
 
 
 async def import_genres_batch(
-    genres_batch: List[GenreImportModel]
+    genres_batch: List[Dict[str, Any]],
+    earlier_batches: Optional[
+        Callable[[Set[Tuple[str, Any]]], Set[asyncio.Task]]
+    ] = None,
 ) -> Dict[str, int]:
-    """Импорт батча жанров в базу данных с поддержкой upsert."""
-    result = {"created": 0, "updated": 0, "errors": 0}
-    
-    async with async_session() as session:
+    """Импорт батча жанров в базу данных.
+
+    Существующие жанры выбираются одним запросом по id и названиям,
+    дальше каждая запись классифицируется локально, без обращений к базе.
+    Запись идет через Core: один INSERT и один UPDATE (executemany)
+    на батч, без unit of work и identity map ORM.
+
+    earlier_batches по ключам найденных строк возвращает более ранние
+    батчи, которые еще пишут в базу. Если такие есть, батч ждет их
+    и перечитывает строки: иначе он классифицировал бы записи по
+    состоянию до их коммита.
+    """
+    # Дубликаты id и названий внутри батча схлопываем: побеждает
+    # последняя запись, как при построчной обработке
+    rows = {row["id"]: row for row in genres_batch}.values()
+    rows = list({row["name"]: row for row in rows}.values())
+
+    query = select(Genre.id, Genre.name).where(
+        or_(
+            Genre.id.in_([row["id"] for row in rows]),
+            Genre.name.in_([row["name"] for row in rows]),
+        )
+    )
+
+    async with import_session() as session:
         try:
-            async with session.begin():
-                for genre_data in genres_batch:
-                    try:
-                        existing_genre = await session.get(
-                            Genre, genre_data.id
+            while True:
+                async with session.begin():
+                    existing = (await session.execute(query)).all()
+                    blockers = set()
+                    if earlier_batches is not None:
+                        blockers = earlier_batches(
+                            batch_keys([row._mapping for row in existing])
                         )
-                        
-                        if existing_genre:
-                            existing_genre.name = genre_data.name
-                            result["updated"] += 1
-                            logger.debug(
-                                f"Обновлен жанр: {genre_data.id} - "
-                                f"{genre_data.name}"
+
+                    if not blockers:
+                        to_insert, to_update, errors = classify_genres(
+                            rows, existing
+                        )
+
+                        # UPDATE выполняется первым и построчно в порядке
+                        # файла: вставляемые записи могут занимать
+                        # названия и id, которые освобождают обновления
+                        if to_update:
+                            await session.execute(
+                                update(genres_table)
+                                .where(genres_table.c.id == bindparam("b_id"))
+                                .values(
+                                    id=bindparam("b_new_id"),
+                                    name=bindparam("b_name"),
+                                ),
+                                to_update,
                             )
-                        else:
-                            from sqlalchemy import select
-                            query = select(Genre).where(
-                                Genre.name == genre_data.name
+                        if to_insert:
+                            await session.execute(
+                                insert(genres_table), to_insert
                             )
-                            existing_by_name = (
-                                await session.execute(query)
-                            ).scalar_one_or_none()
-                            
-                            if existing_by_name:
-                                existing_by_name.id = genre_data.id
-                                existing_by_name.name = genre_data.name
-                                result["updated"] += 1
-                                logger.debug(
-                                    f"Обновлен жанр по названию: "
-                                    f"{genre_data.id} - "
-                                    f"{genre_data.name}"
-                                )
-                            else:
-                                new_genre = Genre(
-                                    id=genre_data.id, name=genre_data.name
-                                )
-                                session.add(new_genre)
-                                result["created"] += 1
-                                logger.debug(
-                                    f"Создан новый жанр: {genre_data.id} - "
-                                    f"{genre_data.name}"
-                                )
-                    
-                    except Exception as e:
-                        result["errors"] += 1
-                        logger.error(
-                            f"Ошибка при импорте жанра {genre_data.id}: "
-                            f"{str(e)}"
-                        )
-            
-            await session.commit()
+
+                if not blockers:
+                    break
+                await asyncio.wait(blockers)
+
+            result = {
+                "created": len(to_insert),
+                "updated": len(to_update),
+                "errors": errors,
+            }
+            renamed = sum(
+                params["b_id"] != params["b_new_id"] for params in to_update
+            )
+
+            # Одна строка на батч вместо сообщения на каждую запись
+            logger.debug(
+                "Детали батча: создано %d, обновлено по id %d, "
+                "обновлено по названию %d",
+                len(to_insert), len(to_update) - renamed, renamed,
+            )
+
             logger.info(
                 f"Батч успешно обработан: создано {result['created']}, "
                 f"обновлено {result['updated']}, ошибок {result['errors']}"
             )
-            
+
         except Exception as e:
-            await session.rollback()
             logger.error(f"Ошибка при обработке батча: {str(e)}")
-            result["errors"] += len(genres_batch)
-    
+            result = {"created": 0, "updated": 0, "errors": len(genres_batch)}
+
     return result
 
 
+async def iter_batches(
+    rows: AsyncIterator[Dict[str, Any]], batch_size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Нарезка потока записей на батчи размером batch_size."""
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def import_genres_batch_limited(
+    genres_batch: List[Dict[str, Any]],
+    semaphore: asyncio.Semaphore,
+    earlier_batches: Callable[[Set[Tuple[str, Any]]], Set[asyncio.Task]],
+) -> Dict[str, int]:
+    """Импорт батча с освобождением слота семафора по завершении."""
+    try:
+        return await import_genres_batch(genres_batch, earlier_batches)
+    finally:
+        semaphore.release()
+
+
+def batch_keys(genres_batch: List[Dict[str, Any]]) -> Set[Tuple[str, Any]]:
+    """Ключи батча, по которым батчи могут конфликтовать в базе."""
+    keys = {("id", row["id"]) for row in genres_batch}
+    keys.update(("name", row["name"]) for row in genres_batch)
+    return keys
+
+
+def find_earlier_batches(
+    in_flight: Dict[Tuple[str, Any], Tuple[int, asyncio.Task]],
+    seq: int,
+    keys: Set[Tuple[str, Any]],
+) -> Set[asyncio.Task]:
+    """Батчи в работе, запущенные раньше батча seq и держащие ключи keys.
+
+    Батч ждет только более ранние батчи, поэтому самый ранний батч
+    в работе никогда не ждет и взаимной блокировки нет.
+    """
+    blockers = set()
+    for key in keys:
+        holder = in_flight.get(key)
+        if holder is not None and holder[0] < seq:
+            blockers.add(holder[1])
+    return blockers
+
+
+def release_batch_keys(
+    in_flight: Dict[Tuple[str, Any], Tuple[int, asyncio.Task]],
+    keys: Set[Tuple[str, Any]],
+    task: asyncio.Task,
+) -> None:
+    """Снятие ключей завершившегося батча из словаря батчей в работе."""
+    for key in keys:
+        holder = in_flight.get(key)
+        if holder is not None and holder[1] is task:
+            del in_flight[key]
+
+
 async def import_genres(
     file_path: str, batch_size: int = 100
 ) -> Dict[str, int]:
-    """Основная функция импорта жанров."""
+    """Основная функция импорта жанров.
+
+    Файл читается потоково, а до IMPORT_CONCURRENCY батчей пишутся в базу
+    одновременно: пока одни батчи ждут ответа базы, следующие уже
+    читаются и валидируются. Слот семафора занимается до создания
+    задачи, поэтому в памяти не больше IMPORT_CONCURRENCY батчей в работе.
+    Параллельность совпадает с размером пула, который main() создает
+    для import_session, поэтому батчи не ждут соединения.
+
+    Батч, у которого есть общие id или названия с батчами в работе,
+    запускается только после их завершения: иначе оба классифицировали бы
+    запись до коммита друг друга, и порядок "побеждает последняя запись"
+    терялся бы. Строка может достаться двум батчам и без общих ключей
+    в файле: один находит ее по id, другой по названию. Такие пересечения
+    видны только после выборки существующих строк, поэтому их проверяет
+    сам батч через find_earlier_batches.
+    """
     total_result = {"created": 0, "updated": 0, "errors": 0}
-    
+    processed = 0
+    valid = 0
+
     try:
         if file_path.endswith('.csv'):
-            genres_data = await read_csv_file(file_path)
+            rows = read_csv_file(file_path)
         elif file_path.endswith('.json'):
-            genres_data = await read_json_file(file_path)
+            rows = read_json_file(file_path)
         else:
             raise ValueError(
                 "Неподдерживаемый формат файла. Используйте CSV или JSON."
             )
-        
-        validated_genres = validate_genres_data(genres_data)
-        
-        if not validated_genres:
-            logger.warning("Нет валидных данных для импорта")
-            return total_result
-        
-        for i in range(0, len(validated_genres), batch_size):
-            batch = validated_genres[i:i + batch_size]
-            batch_result = await import_genres_batch(batch)
-            
+
+        semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+        tasks = []
+        in_flight: Dict[Tuple[str, Any], Tuple[int, asyncio.Task]] = {}
+        read_error = None
+
+        async with asyncio.TaskGroup() as tg:
+            try:
+                async for raw_batch in iter_batches(rows, batch_size):
+                    validated_genres = validate_genres_data(
+                        raw_batch, processed + 1
+                    )
+                    processed += len(raw_batch)
+                    total_result["errors"] += (
+                        len(raw_batch) - len(validated_genres)
+                    )
+                    logger.info(f"Прочитано и проверено {processed} записей")
+
+                    if not validated_genres:
+                        continue
+
+                    valid += len(validated_genres)
+                    seq = len(tasks)
+                    keys = batch_keys(validated_genres)
+                    blockers = find_earlier_batches(in_flight, seq, keys)
+                    if blockers:
+                        await asyncio.wait(blockers)
+
+                    await semaphore.acquire()
+                    task = tg.create_task(
+                        import_genres_batch_limited(
+                            validated_genres,
+                            semaphore,
+                            partial(find_earlier_batches, in_flight, seq),
+                        )
+                    )
+                    tasks.append(task)
+                    for key in keys:
+                        in_flight[key] = (seq, task)
+                    task.add_done_callback(
+                        partial(release_batch_keys, in_flight, keys)
+                    )
+            except Exception as e:
+                # Новые батчи не планируются, но уже запущенные
+                # дописываются и попадают в итоговую статистику
+                read_error = e
+
+        for task in tasks:
+            batch_result = task.result()
             total_result["created"] += batch_result["created"]
             total_result["updated"] += batch_result["updated"]
             total_result["errors"] += batch_result["errors"]
-            
-            logger.info(
-                f"Обработано {min(i + batch_size, len(validated_genres))} "
-                f"из {len(validated_genres)} записей"
-            )
-        
+
+        if read_error is not None:
+            raise read_error
+
+        if not valid:
+            logger.warning("Нет валидных данных для импорта")
+            return total_result
+
         logger.info(
             f"Импорт завершен: создано {total_result['created']}, "
             f"обновлено {total_result['updated']}, "
             f"ошибок {total_result['errors']}"
         )
-        
+
     except Exception as e:
         logger.error(f"Критическая ошибка при импорте: {str(e)}")
-        total_result["errors"] += (
-            len(genres_data) if 'genres_data' in locals() else 0
-        )
-    
+
     return total_result
 
 
@@ -240,11 +568,22 @@ async def main():
     
     batch_size = int(os.getenv("BATCH_SIZE", "100"))
     logger.info(f"Размер батча: {batch_size}")
+    logger.info(f"Параллельных батчей: {IMPORT_CONCURRENCY}")
     
-    await create_tables()
-    
-    result = await import_genres(file_path, batch_size)
-    
+    # Отдельный пул под импорт: у каждого батча в работе свое соединение,
+    # max_overflow=0 не дает импорту открыть больше соединений
+    import_engine = create_async_engine(
+        DATABASE_URL, pool_size=IMPORT_CONCURRENCY, max_overflow=0
+    )
+    import_session.configure(bind=import_engine)
+
+    try:
+        await create_tables()
+        result = await import_genres(file_path, batch_size)
+    finally:
+        await import_engine.dispose()
+        await engine.dispose()
+
     logger.info("=== Итоговая статистика ===")
     logger.info(f"Создано: {result['created']}")
     logger.info(f"Обновлено: {result['updated']}")
@@ -252,8 +591,19 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    
+    # Настройка логирования
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("import_genres.log"),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,15 +1,19 @@
 import asyncio
 import os
 import sys
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import (
-    AsyncSession, create_async_engine, async_sessionmaker
-)
-from sqlalchemy.pool import NullPool
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+try:
+    import uvloop
+except ImportError:  # uvloop не собирается под Windows
+    uvloop = None
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
@@ -20,45 +24,73 @@ from app.database.db import Base, get_db
 from app.main import app
 
 
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# In-memory база живет, пока открыто соединение, поэтому StaticPool
+# держит одно соединение на всю сессию тестов. При запуске через
+# pytest-xdist у каждого воркера-процесса своя база
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+)
+
+
+# pysqlite сам управляет BEGIN и ломает SAVEPOINT, поэтому транзакции
+# открываются явно
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-test_engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
-test_async_session = async_sessionmaker(test_engine, expire_on_commit=False)
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest_asyncio.fixture(scope="session", autouse=True)
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
 async def prepare_database():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
 async def session() -> AsyncGenerator[AsyncSession, None]:
-    async with test_async_session() as session:
-        yield session
-        await session.rollback()
-
-
-@pytest.fixture(scope="function")
-def client(session) -> Generator[TestClient, None, None]:
-    from fastapi.testclient import TestClient
-
+    # Тест идет внутри внешней транзакции, которая откатывается в конце.
+    # Сессия работает в SAVEPOINT: commit и rollback в обработчиках
+    # затрагивают только его, а данные не переживают тест
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def client(session) -> AsyncGenerator[AsyncClient, None]:
     def override_get_db():
         yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as c:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
         yield c
 
     app.dependency_overrides.clear()
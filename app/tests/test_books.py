@@ -1,8 +1,12 @@
 from uuid import uuid4
 
+import pytest
 
-def test_get_books_empty(client):
-    response = client.get("/api/v1/books/")
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_get_books_empty(client):
+    response = await client.get("/api/v1/books/")
     assert response.status_code == 200
     data = response.json()
     assert data["items"] == []
@@ -11,7 +15,7 @@ def test_get_books_empty(client):
     assert data["page_size"] == 10
 
 
-def test_create_book(client):
+async def test_create_book(client):
     book_data = {
         "title": "Тестовая книга",
         "rating": 4.5,
@@ -20,7 +24,7 @@ def test_create_book(client):
         "genre_ids": [],
         "contributors": []
     }
-    response = client.post("/api/v1/books/", json=book_data)
+    response = await client.post("/api/v1/books/", json=book_data)
     assert response.status_code == 201
     data = response.json()
     assert data["title"] == book_data["title"]
@@ -30,7 +34,7 @@ def test_create_book(client):
     assert "id" in data
 
 
-def test_get_book_by_id(client):
+async def test_get_book_by_id(client):
     book_data = {
         "title": "Книга для получения по ID",
         "rating": 3.8,
@@ -39,12 +43,12 @@ def test_get_book_by_id(client):
         "genre_ids": [],
         "contributors": []
     }
-    create_response = client.post("/api/v1/books/", json=book_data)
+    create_response = await client.post("/api/v1/books/", json=book_data)
     assert create_response.status_code == 201
     created_book = create_response.json()
     book_id = created_book["id"]
 
-    response = client.get(f"/api/v1/books/{book_id}")
+    response = await client.get(f"/api/v1/books/{book_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == book_id
@@ -54,14 +58,14 @@ def test_get_book_by_id(client):
     assert data["published_year"] == book_data["published_year"]
 
 
-def test_get_book_not_found(client):
+async def test_get_book_not_found(client):
     non_existent_id = uuid4()
-    response = client.get(f"/api/v1/books/{non_existent_id}")
+    response = await client.get(f"/api/v1/books/{non_existent_id}")
     assert response.status_code == 404
     assert response.json()["detail"] == "Книга не найдена"
 
 
-def test_delete_book(client):
+async def test_delete_book(client):
     book_data = {
         "title": "Книга для удаления",
         "rating": 5.0,
@@ -70,31 +74,27 @@ def test_delete_book(client):
         "genre_ids": [],
         "contributors": []
     }
-    create_response = client.post("/api/v1/books/", json=book_data)
+    create_response = await client.post("/api/v1/books/", json=book_data)
     assert create_response.status_code == 201
     created_book = create_response.json()
     book_id = created_book["id"]
 
-    response = client.delete(f"/api/v1/books/{book_id}")
+    response = await client.delete(f"/api/v1/books/{book_id}")
     assert response.status_code == 204
 
-    get_response = client.get(f"/api/v1/books/{book_id}")
+    get_response = await client.get(f"/api/v1/books/{book_id}")
     assert get_response.status_code == 404
     assert get_response.json()["detail"] == "Книга не найдена"
 
 
-def test_delete_book_not_found(client):
+async def test_delete_book_not_found(client):
     non_existent_id = uuid4()
-    response = client.delete(f"/api/v1/books/{non_existent_id}")
+    response = await client.delete(f"/api/v1/books/{non_existent_id}")
     assert response.status_code == 404
     assert response.json()["detail"] == "Книга не найдена"
 
 
-def test_get_books_with_pagination(client):
-    initial_response = client.get("/api/v1/books/")
-    initial_data = initial_response.json()
-    initial_count = initial_data["total"]
-
+async def test_get_books_with_pagination(client):
     for i in range(15):
         book_data = {
             "title": f"Книга для пагинации {i + 1}",
@@ -104,24 +104,24 @@ def test_get_books_with_pagination(client):
             "genre_ids": [],
             "contributors": []
         }
-        client.post("/api/v1/books/", json=book_data)
+        await client.post("/api/v1/books/", json=book_data)
 
-    response = client.get("/api/v1/books/?page=1&page_size=5")
+    response = await client.get("/api/v1/books/?page=1&page_size=5")
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 5
-    assert data["total"] == initial_count + 15
+    assert data["total"] == 15
     assert data["page"] == 1
     assert data["page_size"] == 5
 
-    response = client.get("/api/v1/books/?page=2&page_size=5")
+    response = await client.get("/api/v1/books/?page=2&page_size=5")
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 5
     assert data["page"] == 2
 
 
-def test_get_books_with_search(client):
+async def test_get_books_with_search(client):
     books = [
         {"title": "Python программирование", "rating": 4.5,
          "published_year": 2020},
@@ -142,9 +142,9 @@ def test_get_books_with_search(client):
             "genre_ids": [],
             "contributors": []
         }
-        client.post("/api/v1/books/", json=book_data)
+        await client.post("/api/v1/books/", json=book_data)
 
-    response = client.get("/api/v1/books/?q=Python")
+    response = await client.get("/api/v1/books/?q=Python")
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 2
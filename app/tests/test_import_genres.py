@@ -0,0 +1,363 @@
+import asyncio
+import os
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app import import_genres
+from app.database.db import Base
+from app.genre.models import Genre
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GENRES_CSV = os.path.join(APP_DIR, "genres.csv")
+GENRES_JSON = os.path.join(APP_DIR, "genres.json")
+
+ID_1 = UUID(int=1)
+ID_2 = UUID(int=2)
+ID_3 = UUID(int=3)
+
+
+@pytest.fixture(scope="function")
+def import_db(session, monkeypatch):
+    # Импорт пишет в то же соединение, что и тестовая сессия, поэтому
+    # его данные откатываются вместе с тестом. Соединение одно, так что
+    # батчи должны идти по одному
+    monkeypatch.setattr(import_genres, "IMPORT_CONCURRENCY", 1)
+    monkeypatch.setattr(
+        import_genres,
+        "import_session",
+        async_sessionmaker(
+            bind=session.bind,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ),
+    )
+    return session
+
+
+class SlowSession(AsyncSession):
+    # Пауза после каждого запроса, чтобы батчи гарантированно
+    # пересекались во времени
+    async def execute(self, *args, **kwargs):
+        result = await super().execute(*args, **kwargs)
+        await asyncio.sleep(0.01)
+        return result
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def parallel_db(tmp_path, monkeypatch):
+    # Параллельным батчам нужны отдельные соединения, а у общей тестовой
+    # базы оно одно: здесь файл SQLite с обычным пулом
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'genres.db'}"
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    monkeypatch.setattr(import_genres, "IMPORT_CONCURRENCY", 4)
+    monkeypatch.setattr(
+        import_genres,
+        "import_session",
+        async_sessionmaker(engine, class_=SlowSession, expire_on_commit=False),
+    )
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+async def get_genres(session):
+    result = await session.execute(select(Genre.id, Genre.name))
+    return dict(result.all())
+
+
+def test_validate_genres_data_strips_and_drops_invalid(caplog):
+    rows = [
+        {"id": str(ID_1), "name": "  Фэнтези  ", "extra": 1},
+        {"id": "bad", "name": "Драма"},
+        {"id": str(ID_2), "name": "   "},
+        {"id": str(ID_3), "name": "Комедия"},
+    ]
+
+    validated = import_genres.validate_genres_data(rows, start=11)
+
+    assert validated == [
+        {"id": ID_1, "name": "Фэнтези"},
+        {"id": ID_3, "name": "Комедия"},
+    ]
+    assert "Ошибка валидации записи #12" in caplog.text
+    assert "Ошибка валидации записи #13" in caplog.text
+    assert "#11" not in caplog.text
+    assert "#14" not in caplog.text
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_create_and_update_by_id(import_db):
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Фэнтези"},
+        {"id": ID_2, "name": "Драма"},
+    ])
+    assert result == {"created": 2, "updated": 0, "errors": 0}
+
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Фантастика"},
+    ])
+    assert result == {"created": 0, "updated": 1, "errors": 0}
+
+    assert await get_genres(import_db) == {
+        ID_1: "Фантастика", ID_2: "Драма"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_rename_by_name(import_db):
+    await import_genres.import_genres_batch([{"id": ID_1, "name": "Драма"}])
+
+    result = await import_genres.import_genres_batch([
+        {"id": ID_2, "name": "Драма"},
+    ])
+
+    assert result == {"created": 0, "updated": 1, "errors": 0}
+    assert await get_genres(import_db) == {ID_2: "Драма"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_collapses_duplicate_ids(import_db):
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Первое"},
+        {"id": ID_1, "name": "Последнее"},
+    ])
+
+    assert result == {"created": 1, "updated": 0, "errors": 0}
+    assert await get_genres(import_db) == {ID_1: "Последнее"}
+
+
+@pytest.mark.parametrize(
+    "reader, path",
+    [
+        (import_genres.read_csv_file, GENRES_CSV),
+        (import_genres.read_json_file, GENRES_JSON),
+    ],
+)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_read_shipped_files(reader, path):
+    rows = [row async for row in reader(path)]
+
+    assert len(rows) == 5
+    assert rows[0] == {
+        "id": "550e8400-e29b-41d4-a716-446655440000", "name": "Fantasy"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_from_csv(import_db):
+    result = await import_genres.import_genres(GENRES_CSV, batch_size=2)
+
+    assert result == {"created": 5, "updated": 0, "errors": 0}
+    assert len(await get_genres(import_db)) == 5
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_collapses_duplicate_names(import_db):
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Одинаковое"},
+        {"id": ID_2, "name": "Одинаковое"},
+        {"id": ID_3, "name": "Другое"},
+    ])
+
+    assert result == {"created": 2, "updated": 0, "errors": 0}
+    assert await get_genres(import_db) == {
+        ID_2: "Одинаковое", ID_3: "Другое"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_skips_conflicting_rows(import_db):
+    await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Драма"},
+        {"id": ID_2, "name": "Комедия"},
+    ])
+
+    # Название "Комедия" занято жанром ID_2, остальные записи батча
+    # импортируются
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Комедия"},
+        {"id": ID_3, "name": "Ужасы"},
+    ])
+
+    assert result == {"created": 1, "updated": 0, "errors": 1}
+    assert await get_genres(import_db) == {
+        ID_1: "Драма", ID_2: "Комедия", ID_3: "Ужасы"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_reuses_name_freed_in_batch(import_db):
+    await import_genres.import_genres_batch([{"id": ID_1, "name": "Старое"}])
+
+    # ID_1 освобождает название "Старое", и ID_3 создается с ним
+    result = await import_genres.import_genres_batch([
+        {"id": ID_1, "name": "Новое"},
+        {"id": ID_3, "name": "Старое"},
+    ])
+
+    assert result == {"created": 1, "updated": 1, "errors": 0}
+    assert await get_genres(import_db) == {ID_1: "Новое", ID_3: "Старое"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_batch_reuses_id_freed_in_batch(import_db):
+    await import_genres.import_genres_batch([{"id": ID_1, "name": "Драма"}])
+
+    # Жанр "Драма" переходит на ID_2, после чего ID_1 создается заново
+    result = await import_genres.import_genres_batch([
+        {"id": ID_2, "name": "Драма"},
+        {"id": ID_1, "name": "Комедия"},
+    ])
+
+    assert result == {"created": 1, "updated": 1, "errors": 0}
+    assert await get_genres(import_db) == {ID_1: "Комедия", ID_2: "Драма"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_read_json_file_requires_array(tmp_path):
+    path = tmp_path / "genres.json"
+    path.write_text('{"id": "%s", "name": "Драма"}' % ID_1, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        [row async for row in import_genres.read_json_file(str(path))]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_counts_batches_before_read_error(
+    import_db, tmp_path
+):
+    # Первая порция JSON (1000 записей) читается целиком, на второй
+    # файл обрывается
+    rows = ", ".join(
+        '{"id": "%s", "name": "Жанр %d"}' % (UUID(int=i), i)
+        for i in range(1, 1501)
+    )
+    path = tmp_path / "genres.json"
+    path.write_text(f"[{rows}, {{\"id\": ", encoding="utf-8")
+
+    result = await import_genres.import_genres(str(path), batch_size=500)
+
+    assert result == {"created": 1000, "updated": 0, "errors": 0}
+    assert len(await get_genres(import_db)) == 1000
+
+
+def write_csv(tmp_path, rows):
+    path = tmp_path / "genres.csv"
+    lines = ["id,name"] + [f"{genre_id},{name}" for genre_id, name in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_skips_malformed_csv_rows(import_db, tmp_path):
+    path = tmp_path / "genres.csv"
+    path.write_text(
+        f"id,name\n{ID_1},Драма\n{ID_2}\n{ID_3},Комедия,лишнее\n"
+        f"{UUID(int=4)},Ужасы\n",
+        encoding="utf-8",
+    )
+
+    result = await import_genres.import_genres(str(path), batch_size=10)
+
+    assert result == {"created": 2, "updated": 0, "errors": 2}
+    assert await get_genres(import_db) == {
+        ID_1: "Драма", UUID(int=4): "Ужасы"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_from_empty_csv(import_db, tmp_path):
+    path = tmp_path / "genres.csv"
+    path.write_text("", encoding="utf-8")
+
+    assert [row async for row in import_genres.read_csv_file(str(path))] == []
+    result = await import_genres.import_genres(str(path))
+
+    assert result == {"created": 0, "updated": 0, "errors": 0}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_runs_disjoint_batches_concurrently(
+    tmp_path, monkeypatch
+):
+    active = []
+    overlaps = []
+    max_active = 0
+
+    async def fake_batch(genres_batch, earlier_batches=None):
+        nonlocal max_active
+        keys = import_genres.batch_keys(genres_batch)
+        overlaps.extend(
+            keys & import_genres.batch_keys(other) for other in active
+        )
+        active.append(genres_batch)
+        max_active = max(max_active, len(active))
+        await asyncio.sleep(0.01)
+        active.remove(genres_batch)
+        return {"created": len(genres_batch), "updated": 0, "errors": 0}
+
+    monkeypatch.setattr(import_genres, "IMPORT_CONCURRENCY", 4)
+    monkeypatch.setattr(import_genres, "import_genres_batch", fake_batch)
+    path = write_csv(tmp_path, [
+        (ID_1, "A"), (ID_2, "B"),
+        (UUID(int=4), "C"), (UUID(int=5), "D"),
+        (ID_1, "A2"), (UUID(int=6), "E"),
+    ])
+
+    result = await import_genres.import_genres(path, batch_size=2)
+
+    assert result == {"created": 6, "updated": 0, "errors": 0}
+    assert max_active == 2
+    assert not any(overlaps)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_repeated_id_in_later_batch(
+    parallel_db, tmp_path
+):
+    path = write_csv(tmp_path, [
+        (ID_1, "A"), (ID_2, "B"), (ID_1, "A2"), (UUID(int=4), "D"),
+    ])
+
+    result = await import_genres.import_genres(path, batch_size=2)
+
+    assert result == {"created": 3, "updated": 1, "errors": 0}
+    assert await get_genres(parallel_db) == {
+        ID_1: "A2", ID_2: "B", UUID(int=4): "D"
+    }
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [(ID_1, "Новое"), (ID_3, "Старое")],
+        [(ID_3, "Старое"), (ID_1, "Новое")],
+    ],
+)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_genres_waits_for_batch_changing_found_row(
+    parallel_db, tmp_path, rows
+):
+    parallel_db.add(Genre(id=ID_1, name="Старое"))
+    await parallel_db.commit()
+
+    # Ключи батчей в файле не пересекаются, но один находит по id,
+    # а другой по названию одну и ту же строку
+    path = write_csv(tmp_path, rows)
+
+    result = await import_genres.import_genres(path, batch_size=1)
+
+    assert result == {"created": 1, "updated": 1, "errors": 0}
+    assert await get_genres(parallel_db) == {ID_1: "Новое", ID_3: "Старое"}